@@ -129,6 +129,33 @@ class TestCombinatorialComplex:
         assert (2, 3, 4) in CCC.cells
         assert (3, 4, 5) in CCC.cells
 
+    def test_add_cells_unchecked(self):
+        """Test adding cells without checking the CCC condition."""
+        CCC = CombinatorialComplex()
+        CCC.add_cells_unchecked(
+            [
+                (frozenset({1, 2}), 1, {"weight": 2}),
+                (frozenset({1, 2, 3}), 2, {"color": "red"}),
+            ]
+        )
+        assert CCC.cells.get_rank((1, 2)) == 1
+        assert CCC.cells.get_rank((1, 2, 3)) == 2
+        assert CCC.cells[(1, 2)]["weight"] == 2
+        assert CCC.cells[(1, 2, 3)]["weight"] == 1
+        assert CCC.cells[(1, 2, 3)]["color"] == "red"
+        assert 3 in CCC.nodes
+
+        with pytest.raises(ValueError):
+            CCC.add_cells_unchecked([(frozenset({1, 3}), 0, {})])
+        with pytest.raises(ValueError):
+            CCC.add_cells_unchecked([(frozenset({4}), 1, {})])
+        with pytest.raises(ValueError):
+            CCC.add_cells_unchecked([(frozenset({1, 2}), 2, {})])
+        with pytest.raises(ValueError):
+            CombinatorialComplex(graph_based=True).add_cells_unchecked(
+                [(frozenset({1, 2, 3}), 1, {})]
+            )
+
     def test_remove_cell(self):
         """Test removing a cell from a CCC."""
         CCC = CombinatorialComplex([[1, 2, 3], [2, 3, 4]], ranks=2)
@@ -172,6 +172,14 @@ class TestPathComplex:
         with pytest.raises(ValueError):
             PC.skeleton(3)
 
+        # cached skeletons are updated when the complex is modified
+        PC.add_path([0, 3])
+        assert PC.skeleton(1) == [(0, 1), (0, 3), (1, 2), (1, 3), (2, 3)]
+        PC.remove_nodes([2])
+        assert PC.skeleton(0) == [(0,), (1,), (3,)]
+        assert PC.skeleton(1) == [(0, 1), (0, 3), (1, 3)]
+        assert PC.incidence_matrix(1).shape == (3, 3)
+
     def test_skeleton_raise_errors(self):
         """Test skeleton raise errors."""
         PC = PathComplex([[1, 2, 3], [1, 3]])
@@ -321,6 +329,10 @@ class TestPathComplex:
         assert [1, 2] in PC.edges
         assert [2, 4] in PC.edges
 
+        PC.add_paths_from(path for path in [(4, 5), (1, 2, 5)])
+        assert [4, 5] in PC.paths
+        assert [1, 2, 5] in PC.paths
+
     def test_add_node(self):
         """Test add node."""
         PC = PathComplex()
@@ -352,6 +364,12 @@ class TestPathComplex:
         assert [1, 2] not in PC.edges
         assert [1, 3] not in PC.edges
 
+        # removing a node can empty several ranks at once
+        PC = PathComplex([[0, 1, 2]])
+        PC.remove_nodes([1])
+        assert PC.dim == 0
+        assert list(PC.paths) == [(0,), (2,)]
+
     def test_incidence_matrix(self):
         """Test incidence matrix."""
         PC = PathComplex(
@@ -430,6 +448,46 @@ class TestPathComplex:
             )
         )
 
+        # modifying a returned matrix must not affect the cached boundary
+        B = PC.incidence_matrix(2)
+        B.data[:] = 0
+        assert PC.incidence_matrix(2).count_nonzero() == 13
+
+        # adding a path of a lower rank shifts the rows of the cached boundary
+        PC.add_path([0, 2])
+        expected = PathComplex(
+            [[0, 1], [1, 2, 3], [1, 3, 2], [2, 1, 3], [0, 1, 2], [0, 1, 3], [0, 2]]
+        )
+        assert PC.incidence_matrix(2).shape == (5, 5)
+        assert np.all(
+            PC.incidence_matrix(2).todense() == expected.incidence_matrix(2).todense()
+        )
+
+    def test_incidence_matrix_modified_graph(self):
+        """Test that modifying the source graph does not break the incidence matrix."""
+        G = nx.Graph([(1, 2), (2, 3)])
+        PC = PathComplex(G)
+        G.remove_node(1)
+        assert np.array_equal(
+            PC.incidence_matrix(1).todense(), np.array([[-1, 0], [1, -1], [0, 1]])
+        )
+
+    def test_boundary_indices(self):
+        """Test that all implementations of the boundary computation agree."""
+        G = nx.Graph()
+        G.add_edges_from([(0, 1), (1, 2), (2, 3), (1, 3), (3, "a"), ("a", 0)])
+        for reserve_sequence_order in [False, True]:
+            PC = PathComplex(G, reserve_sequence_order=reserve_sequence_order)
+            for rank in range(1, PC.dim + 1):
+                assert np.array_equal(
+                    PC._boundary_indices_packed(rank), PC._boundary_indices(rank)
+                )
+
+        PC = PathComplex([[1, 2]])
+        PC.remove_nodes([1])
+        PC.add_path([3, 4])
+        assert np.array_equal(PC._boundary_indices_packed(1), [[2, 1]])
+
     def test_up_laplacian_matrix(self):
         """Test up laplacian matrix."""
         PC = PathComplex(
@@ -569,6 +627,13 @@ class TestPathComplex:
         row, adj = PC.adjacency_matrix(1, index=True)
         assert row == PC.incidence_matrix(1, index=True)[1]
 
+        # cached Laplacians are neither modified by nor stale after other operations
+        L_up = PC.up_laplacian_matrix(0).todense()
+        PC.adjacency_matrix(0)
+        assert np.all(PC.up_laplacian_matrix(0).todense() == L_up)
+        PC.add_path([0, 3])
+        assert PC.adjacency_matrix(0, signed=False).todense()[0, 3] == 1
+
     def test_coadjacency_matrix(self):
         """Test coadjacency matrix."""
         PC = PathComplex(
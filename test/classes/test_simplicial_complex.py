@@ -5,7 +5,7 @@ from unittest.mock import Mock
 import networkx as nx
 import numpy as np
 import pytest
-from scipy.sparse import bmat
+from scipy.sparse import bmat, csr_matrix
 
 from toponetx.classes.combinatorial_complex import CombinatorialComplex
 from toponetx.classes.simplex import Simplex
@@ -112,6 +112,15 @@ class TestSimplicialComplex:
             str(SC)
         ) == f"Simplicial Complex with shape {SC.shape} and dimension {SC.dim}"
 
+    def test_len(self):
+        """Test the number of nodes of the simplicial complex."""
+        assert len(SimplicialComplex()) == 0
+        SC = SimplicialComplex([[1, 2, 3], [2, 4], [5]])
+        assert len(SC) == 5
+        assert len(SC.simplices) == 10
+        SC.remove_nodes([1])
+        assert len(SC) == 4
+
     def test_rep_str(self):
         """Test repr string."""
         G = nx.Graph()
@@ -198,6 +207,28 @@ class TestSimplicialComplex:
             SC = SimplicialComplex()
             SC.add_simplices_from(4)
 
+        # simplices keep their input order, attributes and maximality information
+        # as when adding them one by one
+        simplices = [
+            Simplex((1, 2), weight=1),
+            (2, 3),
+            Simplex((1, 2, 3), weight=3),
+            (3, 4),
+            (1, 2),
+        ]
+        SC = SimplicialComplex()
+        SC.add_simplices_from(simplices)
+        SC_sequential = SimplicialComplex()
+        for simplex in simplices:
+            SC_sequential.add_simplex(simplex)
+        assert list(SC.simplices) == list(SC_sequential.simplices)
+        for simplex in SC.simplices:
+            assert SC[simplex] == SC_sequential[simplex]
+        assert SC[(1, 2)]["weight"] == 1
+        assert SC[(1, 2, 3)]["weight"] == 3
+        assert not SC.is_maximal((1, 2))
+        assert SC.is_maximal((3, 4))
+
     def test_add_node(self):
         """Test add node."""
         SC = SimplicialComplex()
@@ -383,6 +414,14 @@ class TestSimplicialComplex:
         assert len(SC.skeleton(rank=3)) == len(threefaces)
         assert len(SC.skeleton(rank=4)) == len(fourfaces)
 
+        # modifying the returned list or the complex must not affect later calls
+        SC.skeleton(1).clear()
+        assert len(SC.skeleton(1)) == len(edges)
+        SC.add_simplex((100, 101))
+        assert (100, 101) in SC.skeleton(1)
+        SC.remove_maximal_simplex((100, 101))
+        assert (100, 101) not in SC.skeleton(1)
+
     def test_incidence_matrix_1(self):
         """Test incidence_matrix shape and values."""
         # create a SimplicialComplex object with a few simplices
@@ -487,8 +526,37 @@ class TestSimplicialComplex:
             ),
         )
 
+        L_hodge = SC.hodge_laplacian_matrix(rank=1)
+        np.testing.assert_array_equal(
+            L_hodge.toarray(),
+            (
+                SC.up_laplacian_matrix(rank=1) + SC.down_laplacian_matrix(rank=1)
+            ).toarray(),
+        )
+
         with pytest.raises(ValueError):
             SC.hodge_laplacian_matrix(rank=3)
+        with pytest.raises(ValueError):
+            SC.hodge_laplacian_matrix(rank=-1)
+
+    def test_hodge_laplacian_operator(self):
+        """Test that the hodge laplacian operator matches the hodge laplacian matrix."""
+        SC = SimplicialComplex([[1, 2, 3], [2, 3, 4], [0, 1]])
+        rng = np.random.default_rng(0)
+        for rank in range(SC.dim + 1):
+            L = SC.hodge_laplacian_matrix(rank)
+            L_op = SC.hodge_laplacian_operator(rank)
+            assert L_op.shape == L.shape
+
+            x = rng.standard_normal(L.shape[1])
+            np.testing.assert_allclose(L_op @ x, L @ x, rtol=1e-5)
+            X = rng.standard_normal((L.shape[1], 3))
+            np.testing.assert_allclose(L_op @ X, L @ X, rtol=1e-5)
+
+        with pytest.raises(ValueError):
+            SC.hodge_laplacian_operator(3)
+        with pytest.raises(ValueError):
+            SC.hodge_laplacian_operator(-1)
 
     def test_adjacency_matrix(self):
         """Test adjacency_matrix shape and values."""
@@ -515,9 +583,33 @@ class TestSimplicialComplex:
         expected_ind = {(0,): 0, (1,): 1, (2,): 2, (3,): 3, (4,): 4}
         assert ind == expected_ind
 
+        # the node adjacency is built from the edges, compare with the laplacian
+        L0 = SC.up_laplacian_matrix(rank=0).toarray()
+        np.testing.assert_array_equal(
+            SC.adjacency_matrix(rank=0, signed=True).toarray(),
+            L0 - np.diag(np.diag(L0)),
+        )
+
         with pytest.raises(ValueError):
             A = SC.adjacency_matrix(rank=0, weight=1)
 
+        # clearing the diagonal does not add entries for simplices without cofaces
+        SC.add_node(5)
+        A = SC.adjacency_matrix(rank=0)
+        assert A.shape == (6, 6)
+        assert A.indptr[-1] == A.indptr[-2]
+        assert not A.diagonal().any()
+
+        # cached matrices are neither modified through returned matrices nor stale
+        A.data[:] = 5
+        assert SC.adjacency_matrix(rank=0).max() == 1
+        assert SC.adjacency_matrix(rank=0, signed=True).min() == -1
+        SC.add_simplex([4, 5])
+        assert SC.adjacency_matrix(rank=0)[4, 5] == 1
+        assert SC.coadjacency_matrix(rank=1).shape == (7, 7)
+        SC.add_simplex([3, 4, 5])
+        assert SC.coadjacency_matrix(rank=1).shape == (8, 8)
+
     def test_get_boundaries(self):
         """Test the get_boundaries method."""
         simplices = [(1, 2, 3), (2, 3, 4), (0, 1)]
@@ -565,6 +657,12 @@ class TestSimplicialComplex:
         cofaces = SC.get_cofaces([1, 2, 4], codimension=1)
         assert frozenset({1, 2, 3, 4}) in cofaces
         assert frozenset({3, 4, 8}) not in cofaces
+        assert set(SC.get_cofaces([1, 2], codimension=1)) == {
+            frozenset({1, 2, 3}),
+            frozenset({1, 2, 4}),
+            frozenset({1, 2, 3, 4}),
+        }
+        assert SC.get_cofaces([1, 2], codimension=2) == [frozenset({1, 2, 3, 4})]
         # ... add more assertions based on the expected cofaces
 
     def test_get_star(self):
@@ -602,6 +700,13 @@ class TestSimplicialComplex:
 
         assert set(edges) == set(expected_edges)
 
+        # sparse matrices give the same edges, ignoring explicitly stored zeros
+        sparse_matrix = csr_matrix(matrix)
+        sparse_matrix.data[0] = 0
+        edges = SimplicialComplex().get_edges_from_matrix(sparse_matrix)
+
+        assert list(edges) == expected_edges[1:]
+
     def test_to_hasse_graph(self):
         """Test to hasse graph function."""
         SC = SimplicialComplex()
@@ -624,6 +729,11 @@ class TestSimplicialComplex:
         B2 = SC.incidence_matrix(2)
         assert B1.shape == tuple(SC.shape[:2])
         assert B2.shape == tuple(SC.shape[1:3])
+        assert B1.format == "csc"
+        assert SC.coincidence_matrix(1).format == "csr"
+        assert SC.up_laplacian_matrix(1).format == "csr"
+        assert SC.down_laplacian_matrix(1).format == "csr"
+        assert SC.hodge_laplacian_matrix(1).format == "csr"
         # B1 : 1->0
         # B2 : 2->1
         assert np.sum(abs(B1.dot(B2))) == 0  # boundary of boundary = 0
@@ -655,6 +765,35 @@ class TestSimplicialComplex:
             ),
         )
 
+        # nodes that are not integers are ordered by their own comparison
+        SC = SimplicialComplex([["b", "c", "a"], ["c", "d"]])
+        row, col, B2 = SC.incidence_matrix(2, index=True)
+        assert row == {("a", "b"): 0, ("a", "c"): 1, ("b", "c"): 2, ("c", "d"): 3}
+        assert col == {("a", "b", "c"): 0}
+        np.testing.assert_array_equal(B2.toarray(), np.array([[1, -1, 1, 0]]).T)
+        assert np.sum(abs(SC.incidence_matrix(1) @ B2)) == 0
+
+        # cached incidence matrices are neither modified through returned values
+        # nor returned after the complex has changed
+        row, col, B2 = SC.incidence_matrix(2, index=True)
+        B2.data[:] = 0
+        row.clear()
+        row, col, B2 = SC.incidence_matrix(2, index=True)
+        assert len(row) == 4
+        np.testing.assert_array_equal(B2.toarray(), np.array([[1, -1, 1, 0]]).T)
+        SC.add_simplex(["a", "c", "d"])
+        assert SC.incidence_matrix(2).shape == (5, 2)
+        SC.remove_maximal_simplex(["a", "b", "c"])
+        assert SC.incidence_matrix(2).shape == (5, 1)
+
+        # too many nodes to pack the faces of a 10-simplex into 63 bits
+        SC = SimplicialComplex([range(11)])
+        SC_isolated = SimplicialComplex([range(11), *([n] for n in range(11, 128))])
+        np.testing.assert_array_equal(
+            SC.incidence_matrix(10).toarray(),
+            SC_isolated.incidence_matrix(10).toarray(),
+        )
+
     def test_coincidence_matrix_2(self):
         """Test coincidence matrix."""
         SC = SimplicialComplex()
@@ -816,6 +955,18 @@ class TestSimplicialComplex:
         assert len(result.cells) == len(expected_result.cells)
         assert len(result.nodes) == len(expected_result.nodes)
 
+        # ranks and attributes of the simplices carry over to the cells
+        SC = SimplicialComplex()
+        SC.add_simplex((1, 2, 3), color="red")
+        SC.add_simplex((3, 4), weight=5)
+        result = SC.to_combinatorial_complex()
+        assert result.cells.get_rank((1, 2, 3)) == 2
+        assert result.cells.get_rank((3, 4)) == 1
+        assert result.cells.get_rank((1, 2)) == 1
+        assert result.cells[(1, 2, 3)]["color"] == "red"
+        assert result.cells[(3, 4)]["weight"] == 5
+        assert result.cells[(1, 2)]["weight"] == 1
+
     def test_from_gudhi(self):
         """Create a SimplicialComplex from a Gudhi SimplexTree and compare the number of simplices."""
         gudhi_simplices = [
@@ -882,6 +1033,11 @@ class TestSimplicialComplex:
         result = SC.restrict_to_nodes(node_set)
         assert len(result.simplices) == len(expected_result.simplices)
 
+        # nodes are ordered as they are created by the restricted simplices
+        SC = SimplicialComplex([(1, 3), (2, 3), (4,)])
+        result = SC.restrict_to_nodes([1, 2, 3, 4])
+        assert list(result.nodes) == [frozenset({n}) for n in [1, 3, 2, 4]]
+
     def test_get_all_maximal_simplices(self):
         """Retrieve all maximal simplices from a SimplicialComplex and compare the number of simplices."""
         c1 = Simplex((1, 2, 3))
@@ -1,7 +1,7 @@
 """Test normalization."""
 
 import numpy as np
-from scipy.sparse import csr_matrix
+from scipy.sparse import csr_matrix, diags
 
 from toponetx.utils.normalization import (
     compute_bunch_normalized_matrices,
@@ -24,13 +24,10 @@ def test_compute_laplacian_normalized_matrix():
         ]
     )
 
-    # Calculate the degree matrix
-    degree_matrix = np.diag(adjacency_matrix.sum(axis=1))
+    A = csr_matrix(adjacency_matrix)
 
-    # Calculate the Laplacian matrix
-    L = np.array(degree_matrix - adjacency_matrix)
-
-    L = csr_matrix(L).asfptype()
+    # Calculate the Laplacian matrix from the degree matrix, keeping it sparse
+    L = (diags(np.asarray(A.sum(axis=1)).ravel()) - A).asfptype()
     normalized_L = compute_laplacian_normalized_matrix(L)
     expected_result = [
         [0.5, -0.25, 0.0, 0.0, 0.0, -0.25],
@@ -8,6 +8,7 @@ from scipy.sparse import csr_matrix
 
 from toponetx.classes.cell_complex import CellComplex
 from toponetx.utils.structure import (
+    _abs_inplace,
     compute_set_incidence,
     incidence_to_adjacency,
     neighborhood_list_to_neighborhood_dict,
@@ -188,3 +189,14 @@ class TestStructure:
             children, uidset, index=True
         )
         assert result.size == 1
+
+    def test_abs_inplace(self):
+        """Test the _abs_inplace function."""
+        B = csr_matrix(np.array([[1, -1, 0], [0, -2, 3]]))
+        data = B.data
+        result = _abs_inplace(B)
+        assert result is B
+        assert result.data is data
+        np.testing.assert_array_equal(
+            result.toarray(), np.array([[1, 1, 0], [0, 2, 3]])
+        )
@@ -28,6 +28,7 @@ from toponetx.classes.combinatorial_complex import (
 from toponetx.classes.complex import Complex
 from toponetx.classes.reportviews import CellView
 from toponetx.utils import incidence_to_adjacency
+from toponetx.utils.structure import _abs_inplace
 
 __all__ = ["CellComplex"]
 
@@ -1722,15 +1723,15 @@ class CellComplex(Complex):
                     rank + 1, weight=weight, index=True
                 )
                 L_hodge = B_next @ B_next.transpose()
-                if signed:
-                    return nodelist, L_hodge
-                return nodelist, abs(L_hodge)
+                if not signed:
+                    _abs_inplace(L_hodge)
+                return nodelist, L_hodge
 
             B_next = self.incidence_matrix(rank + 1, weight=weight)
             L_hodge = B_next @ B_next.transpose()
-            if signed:
-                return L_hodge
-            return abs(L_hodge)
+            if not signed:
+                _abs_inplace(L_hodge)
+            return L_hodge
         if rank < 2:  # rank == 1, return L1
             if self.dim == 2:
                 edge_list, cell_list, B_next = self.incidence_matrix(
@@ -1742,7 +1743,7 @@ class CellComplex(Complex):
                 B = self.incidence_matrix(rank, weight=weight)
                 L_hodge = B.transpose() @ B
             if not signed:
-                L_hodge = abs(L_hodge)
+                _abs_inplace(L_hodge)
             if index:
                 return edge_list, L_hodge
             return L_hodge
@@ -1753,7 +1754,7 @@ class CellComplex(Complex):
             )
             L_hodge = B.transpose() @ B
             if not signed:
-                L_hodge = abs(L_hodge)
+                _abs_inplace(L_hodge)
 
             if index:
                 return cell_list, L_hodge
@@ -1824,7 +1825,7 @@ class CellComplex(Complex):
                 f"Rank should larger than 0 and <= {self.dim - 1} (maximal dimension cells-1), got {rank}."
             )
         if not signed:
-            L_up = abs(L_up)
+            _abs_inplace(L_up)
 
         if index:
             return row, L_up
@@ -1881,7 +1882,7 @@ class CellComplex(Complex):
                 f"Rank should be larger than 1 and <= {self.dim} (maximal dimension cells), got {rank}."
             )
         if not signed:
-            L_down = abs(L_down)
+            _abs_inplace(L_down)
         if index:
             return row, L_down
         return L_down
@@ -2010,17 +2011,15 @@ class CellComplex(Complex):
 
         dirac = bmat([[None, B1, None], [B1.T, None, B2], [None, B2.T, None]])
 
+        if not signed:
+            _abs_inplace(dirac)
         if index:
             d = {}
             d.update(index0)
             d.update(index1)
             d.update(index2)
-            if signed:
-                return d, dirac
-            return d, abs(dirac)
-        if signed:
-            return dirac
-        return abs(dirac)
+            return d, dirac
+        return dirac
 
     def restrict_to_cells(
         self,
@@ -1016,6 +1016,48 @@ class CombinatorialComplex(ColoredHyperGraph):
 
         self._add_hyperedge(cell, rank, **attr)
 
+    def add_cells_unchecked(
+        self, cells: Iterable[tuple[frozenset, int, dict[Hashable, Any]]]
+    ) -> None:
+        """Add cells that are known to satisfy the CCC condition.
+
+        Unlike `add_cell`, the rank of a new cell is not compared against the ranks
+        of all cells that share a node with it. This is meant for bulk insertion of
+        cells whose ranks are consistent by construction, e.g., the simplices of a
+        simplicial complex ranked by their dimension. Passing cells that violate the
+        CCC condition results in an invalid combinatorial complex.
+
+        Parameters
+        ----------
+        cells : iterable of tuples
+            Triples `(cell, rank, attr)` of a cell given as a frozenset of at least
+            two nodes, its positive rank and a dict of its attributes.
+
+        Raises
+        ------
+        ValueError
+            If a rank is not a positive integer, a cell has less than two nodes, or a
+            cell is already part of the complex with a different rank.
+        """
+        hyperedge_dict = self._complex_set.hyperedge_dict
+        for cell, rank, attr in cells:
+            if not isinstance(rank, int) or rank < 1:
+                raise ValueError(f"rank must be a positive integer, got {rank}")
+            if len(cell) < 2:
+                raise ValueError(
+                    f"cells of positive rank must have at least two nodes, got {cell}"
+                )
+            if self.graph_based and rank == 1 and len(cell) != 2:
+                raise ValueError(
+                    f"Rank 1 cells in graph-based CombinatorialComplex must have size 2, got {cell}."
+                )
+            for other_rank, other_cells in hyperedge_dict.items():
+                if other_rank != rank and cell in other_cells:
+                    raise ValueError(
+                        f"cell {cell} is already part of the complex with rank {other_rank}"
+                    )
+            self._add_hyperedge_helper(cell, rank, **attr)
+
     def remove_cell(self, cell) -> None:
         """Remove a single cell from CCC.
 
@@ -1,6 +1,7 @@
 """Path complex."""
 
 from collections.abc import Hashable, Iterable, Iterator, Sequence
+from itertools import chain
 from typing import Any
 
 import networkx as nx
@@ -12,10 +13,35 @@ from typing_extensions import Self
 from toponetx.classes.complex import Complex
 from toponetx.classes.path import Path
 from toponetx.classes.reportviews import PathView
+from toponetx.utils.structure import _abs_inplace
 
 __all__ = ["PathComplex"]
 
 
+class _NodeKeys(dict):
+    """Mapping of nodes to their string representation, computed on first access.
+
+    Element access of a dict subclass stays in C for keys that are present, which
+    makes `__getitem__` a cheap key function for orienting and sorting paths.
+    """
+
+    def __missing__(self, node: Hashable) -> str:
+        """Compute and store the string representation of a new node.
+
+        Parameters
+        ----------
+        node : Hashable
+            The node that is not yet in the mapping.
+
+        Returns
+        -------
+        str
+            The string representation of the node.
+        """
+        key = self[node] = str(node)
+        return key
+
+
 class PathComplex(Complex):
     """A class representing a path complex based on simple paths as proposed in [1]_.
 
@@ -109,6 +135,15 @@ class PathComplex(Complex):
 
         self._path_set = PathView()
         self._G = nx.Graph()
+        # sorted skeletons and path2idx dicts per rank, invalidated on modification
+        self._skeleton_cache: dict[int, list[tuple[Hashable]]] = {}
+        self._path2idx_cache: dict[int, dict[tuple[Hashable], int]] = {}
+        # up and down Laplacians keyed by (kind, rank, signed)
+        self._laplacian_cache: dict[tuple[str, int, bool], sp.sparse.csr_matrix] = {}
+        # CSC arrays (indptr, indices, signs) of the signed boundary matrix per rank
+        self._boundary_cache: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        # string representation of each node, used to canonicalize path orientation
+        self._node_keys: dict[Hashable, str] = _NodeKeys()
         self._reserve_sequence_order = reserve_sequence_order
         if allowed_paths is not None:
             if len(allowed_paths) > 0:
@@ -126,14 +161,13 @@ class PathComplex(Complex):
         if isinstance(paths, nx.Graph):
             # compute allowed_paths in order to construct boundary incidence matrix/adj matrix.
             self._G = paths
-            if self._allowed_paths is not None:
-                self._allowed_paths.update(
-                    self.compute_allowed_paths(
-                        paths,
-                        reserve_sequence_order=reserve_sequence_order,
-                        max_rank=max_rank,
-                    )
-                )
+            user_allowed_paths = list(self._allowed_paths)
+            graph_allowed_paths = self.compute_allowed_paths(
+                paths,
+                reserve_sequence_order=reserve_sequence_order,
+                max_rank=max_rank,
+            )
+            self._allowed_paths.update(graph_allowed_paths)
 
             # get feature of nodes and edges if available
             for path, data in paths.nodes(data=True):
@@ -141,12 +175,16 @@ class PathComplex(Complex):
             for u, v, data in paths.edges(
                 data=True
             ):  # so far, path complex only supports undirected graph
-                if (str(u) > str(v)) and not reserve_sequence_order:
+                if (
+                    self._node_key(u) > self._node_key(v)
+                ) and not reserve_sequence_order:
                     u, v = v, u
                 self.add_path((u, v), **data)
 
-            # add all simple paths
-            self.add_paths_from(self._allowed_paths)
+            # add all simple paths. `self._allowed_paths` itself is extended while
+            # adding paths, so iterate over the collections it was built from instead.
+            self.add_paths_from(graph_allowed_paths)
+            self.add_paths_from(user_allowed_paths)
 
         elif isinstance(paths, list | tuple):
             tmp_paths = []
@@ -182,8 +220,7 @@ class PathComplex(Complex):
         >>> PC.paths
         PathView([(1,), (2,), (3,), (4,), (5,), (1, 2), (2, 3), (2, 4), (2, 5), (4, 5), (1, 2, 3), (1, 2, 4), (1, 2, 5)])
         """
-        paths_clone = paths.copy()
-        for p in paths_clone:
+        for p in paths:
             self.add_path(p)
 
     def add_path(self, path: Hashable | Sequence[Hashable] | Path, **attr) -> None:
@@ -223,7 +260,7 @@ class PathComplex(Complex):
                     )
                 if (
                     len(path_) > 1
-                    and str(path_[0]) > str(path_[-1])
+                    and self._node_key(path_[0]) > self._node_key(path_[-1])
                     and not self._reserve_sequence_order
                 ):
                     raise ValueError(
@@ -246,15 +283,25 @@ class PathComplex(Complex):
                 self._update_attributes(path, **attr)
                 return
 
-            # update sub-paths
-            for length in range(len(path_), 0, -1):
-                for i in range(len(path_) - length + 1):
-                    sub_path = path_[i : i + length]
-                    if not self._reserve_sequence_order and str(sub_path[0]) > str(
-                        sub_path[-1]
-                    ):
+            # update sub-paths, one length at a time. Every path in the complex already
+            # contains all its (recursive) obvious sub-paths, so the descent stops at
+            # sub-paths that are already present.
+            node_key = self._node_keys.__getitem__
+            level = [tuple(path_)]
+            while level:
+                next_level = []
+                for window in level:
+                    sub_path = window
+                    if not self._reserve_sequence_order and node_key(
+                        sub_path[0]
+                    ) > node_key(sub_path[-1]):
                         sub_path = sub_path[::-1]
-                    sub_path = tuple(sub_path)
+
+                    # expand _path_set if necessary. keep track of newly added paths to expend _allowed_paths
+                    new_path = self._update_faces_dict_entry(sub_path)
+                    if new_path is None:
+                        continue
+                    new_paths.add(new_path)
 
                     # add to _G
                     if len(sub_path) == 1:
@@ -262,10 +309,9 @@ class PathComplex(Complex):
                     elif len(sub_path) == 2:
                         self._G.add_edge(sub_path[0], sub_path[1])
 
-                    # expand _path_set if necessary. keep track of newly added paths to expend _allowed_paths
-                    new_path = self._update_faces_dict_entry(sub_path)
-                    if new_path is not None:
-                        new_paths.add(new_path)
+                    if len(window) > 1:
+                        next_level.extend((window[:-1], window[1:]))
+                level = next_level
             # update allowed paths
             if len(new_paths) > 0:
                 self._allowed_paths.update(new_paths)
@@ -356,10 +402,13 @@ class PathComplex(Complex):
             Set of elementary p-paths of dimension specified by `rank`.
         """
         if len(self._path_set.faces_dict) > rank >= 0:
-            tmp = (path for path in self._path_set.faces_dict[rank])
-            return sorted(
-                tmp, key=lambda x: tuple(map(str, x))
-            )  # lexicographic comparison
+            if rank not in self._skeleton_cache:
+                node_key = self._node_keys.__getitem__
+                self._skeleton_cache[rank] = sorted(
+                    self._path_set.faces_dict[rank],
+                    key=lambda x: tuple(map(node_key, x)),
+                )  # lexicographic comparison
+            return self._skeleton_cache[rank].copy()
         if rank < 0:
             raise ValueError(f"input must be a positive integer, got {rank}")
         raise ValueError(f"input {rank} exceeds max dim")
@@ -394,17 +443,19 @@ class PathComplex(Complex):
         node_set : Iterable[Hashable]
             An iterable of nodes to be removed.
         """
-        removed_paths = set()
-        for path in self.paths:  # iterate over all paths
-            if any(
-                node in path for node in node_set
-            ):  # if any node in node_set is in the path, remove the path
-                removed_paths.add(path)
-
-        for path in removed_paths:
+        node_set = frozenset(node_set)
+        removed_paths = [
+            path for path in self.paths if not node_set.isdisjoint(path)
+        ]  # if any node in node_set is in the path, remove the path
+
+        # remove the longest paths first, so that `_remove_path` lowers the maximal
+        # dimension past every rank that is emptied
+        for path in sorted(removed_paths, key=len, reverse=True):
             self._remove_path(path)
 
         self._G.remove_nodes_from(node_set)
+        for node in node_set:
+            self._node_keys.pop(node, None)
 
     def incidence_matrix(
         self,
@@ -412,7 +463,7 @@ class PathComplex(Complex):
         signed: bool = True,
         weight: str | None = None,
         index: bool = False,
-    ) -> tuple[dict, dict, sp.sparse.lil_matrix] | sp.sparse.lil_matrix:
+    ) -> tuple[dict, dict, sp.sparse.csc_matrix] | sp.sparse.csc_matrix:
         """Compute incidence matrix of the path complex.
 
         Parameters
@@ -428,7 +479,7 @@ class PathComplex(Complex):
 
         Returns
         -------
-        tuple[dict, dict, sp.sparse.lil_matrix] | sp.sparse.lil_matrix
+        tuple[dict, dict, sp.sparse.csc_matrix] | sp.sparse.csc_matrix
             If `index` is True, return a tuple of (idx_p_minus_1, idx_p, incidence_matrix) otherwise
             if `index` is False, return incidence_matrix.
         """
@@ -439,36 +490,23 @@ class PathComplex(Complex):
                 f"input dimension cannot be larger than the dimension of the complex, got {rank}"
             )
         if rank == 0:
-            boundary = sp.sparse.lil_matrix((0, len(self.nodes)))
+            boundary = sp.sparse.csc_matrix((0, len(self.nodes)))
             if index:
                 node_index = {
-                    (node,): i for i, node in enumerate(sorted(self.nodes, key=str))
+                    (node,): i
+                    for i, node in enumerate(sorted(self.nodes, key=self._node_key))
                 }
-                return {}, node_index, abs(boundary.tocoo())
-            return abs(boundary.tocoo())
-
-        idx_p_minus_1, idx_p, values = [], [], []
-        path_minus_1_dict = {
-            path: i for i, path in enumerate(self.skeleton(rank - 1))
-        }  # path2idx dict
-        path_dict = {
-            path: i for i, path in enumerate(self.skeleton(rank))
-        }  # path2idx dict
-        for path, idx_path in path_dict.items():
-            for i, _ in enumerate(path):
-                boundary_path = path[0:i] + path[(i + 1) :]
-                if not self._reserve_sequence_order and str(boundary_path[0]) > str(
-                    boundary_path[-1]
-                ):
-                    boundary_path = boundary_path[::-1]
-                boundary_path = tuple(boundary_path)
-                if boundary_path in self._allowed_paths:
-                    idx_p_minus_1.append(path_minus_1_dict[boundary_path])
-                    idx_p.append(idx_path)
-                    values.append((-1) ** i)
-        boundary = sp.sparse.coo_matrix(
-            (values, (idx_p_minus_1, idx_p)),
-            dtype=np.float32,
+                return {}, node_index, boundary
+            return boundary
+
+        path_minus_1_dict = self._path2idx(rank - 1)
+        path_dict = self._path2idx(rank)
+
+        if rank not in self._boundary_cache:
+            self._boundary_cache[rank] = self._boundary_arrays(rank)
+        indptr, indices, signs = self._boundary_cache[rank]
+        boundary = sp.sparse.csc_matrix(
+            (signs.astype(np.float32), indices.copy(), indptr.copy()),
             shape=(
                 len(path_minus_1_dict),
                 len(path_dict),
@@ -478,20 +516,197 @@ class PathComplex(Complex):
         if index:
             if signed:
                 return (
-                    path_minus_1_dict,
-                    path_dict,
+                    path_minus_1_dict.copy(),
+                    path_dict.copy(),
                     boundary,
                 )
 
             return (
-                path_minus_1_dict,
-                path_dict,
-                abs(boundary),
+                path_minus_1_dict.copy(),
+                path_dict.copy(),
+                _abs_inplace(boundary),
             )
 
         if signed:
             return boundary
-        return abs(boundary)
+        return _abs_inplace(boundary)
+
+    def _boundary_arrays(self, rank: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute the CSC arrays of the signed boundary matrix of a rank.
+
+        Parameters
+        ----------
+        rank : int
+            The rank of the elementary p-paths, must be positive.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The `indptr` and `indices` arrays as int32 and the signs of the
+            nonzero entries as int8.
+        """
+        n_paths = len(self._path2idx(rank))
+        idx_boundary = self._boundary_indices_packed(rank)
+        if idx_boundary is None:
+            idx_boundary = self._boundary_indices(rank)
+
+        # the entries of each column are contiguous in row-major order of
+        # `idx_boundary`, so the CSC arrays can be read off directly
+        found = idx_boundary >= 0
+        indptr = np.zeros(n_paths + 1, dtype=np.int32)
+        np.cumsum(np.count_nonzero(found, axis=1), out=indptr[1:])
+        signs = np.where(np.arange(rank + 1) % 2 == 0, 1, -1).astype(np.int8)
+        return (
+            indptr,
+            idx_boundary[found].astype(np.int32, copy=False),
+            np.broadcast_to(signs, found.shape)[found],
+        )
+
+    def _boundary_indices(self, rank: int) -> np.ndarray:
+        """Compute the indices of the boundaries of all elementary p-paths of a rank.
+
+        Parameters
+        ----------
+        rank : int
+            The rank of the elementary p-paths, must be at least 1.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n_paths, rank + 1). The entry (j, i) is the index of the
+            boundary path obtained by deleting the i-th node of the j-th path, or -1
+            if that boundary is not part of the complex.
+        """
+        path_minus_1_dict = self._path2idx(rank - 1)
+        path_dict = self._path2idx(rank)
+
+        # stack all p-paths as an object array of shape (n_paths, rank + 1), filled
+        # column by column so that nodes which are themselves sequences stay intact
+        n_paths = len(path_dict)
+        paths_arr = np.empty((n_paths, rank + 1), dtype=object)
+        for j in range(rank + 1):
+            paths_arr[:, j] = np.fromiter(
+                (path[j] for path in path_dict), dtype=object, count=n_paths
+            )
+
+        idx_boundary = np.empty((n_paths, rank + 1), dtype=np.int32)
+        for i in range(rank + 1):
+            boundary_paths = np.delete(paths_arr, i, axis=1)
+            if not self._reserve_sequence_order and rank > 1:
+                first = np.fromiter(
+                    map(self._node_keys.__getitem__, boundary_paths[:, 0]),
+                    dtype=object,
+                )
+                last = np.fromiter(
+                    map(self._node_keys.__getitem__, boundary_paths[:, -1]),
+                    dtype=object,
+                )
+                mask = (first > last).astype(bool)
+                boundary_paths[mask] = boundary_paths[mask, ::-1]
+            # every path in the complex is also an allowed path, so a lookup in the
+            # (p-1)-skeleton is equivalent to checking `self._allowed_paths` first
+            idx_boundary[:, i] = np.fromiter(
+                (
+                    path_minus_1_dict.get(tuple(boundary_path), -1)
+                    for boundary_path in boundary_paths
+                ),
+                dtype=np.int32,
+                count=n_paths,
+            )
+        return idx_boundary
+
+    def _paths_as_node_ids(
+        self, rank: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Relabel the elementary p-paths of a rank and rank - 1 to integer arrays.
+
+        Parameters
+        ----------
+        rank : int
+            The rank of the elementary p-paths, must be at least 1.
+
+        Returns
+        -------
+        paths : np.ndarray
+            Array of shape (n_paths, rank + 1) with the node ids of the p-paths in
+            skeleton order.
+        faces : np.ndarray
+            Array of shape (n_faces, rank) with the node ids of the (p-1)-paths in
+            skeleton order.
+        node_order : np.ndarray
+            The position of each node id in the order used to orient paths. Nodes with
+            the same key share their position.
+        """
+        # the node ids come from the 0-skeleton, as `_G` may be the graph the
+        # complex was built from and hence be modified by the caller
+        node_ids = {node: i for i, (node,) in enumerate(self._path_set.faces_dict[0])}
+        _, node_order = np.unique(
+            np.array([self._node_key(node) for node in node_ids], dtype=object),
+            return_inverse=True,
+        )
+
+        # write the node ids straight into preallocated (n_paths, length) arrays
+        path_dict = self._path2idx(rank)
+        paths = np.fromiter(
+            map(node_ids.__getitem__, chain.from_iterable(path_dict)),
+            dtype=np.int64,
+            count=len(path_dict) * (rank + 1),
+        ).reshape(-1, rank + 1)
+        path_minus_1_dict = self._path2idx(rank - 1)
+        faces = np.fromiter(
+            map(node_ids.__getitem__, chain.from_iterable(path_minus_1_dict)),
+            dtype=np.int64,
+            count=len(path_minus_1_dict) * rank,
+        ).reshape(-1, rank)
+        return paths, faces, node_order.astype(np.int64)
+
+    def _boundary_indices_packed(self, rank: int) -> np.ndarray | None:
+        """Compute the indices of the boundaries of all elementary p-paths of a rank.
+
+        Same as `_boundary_indices`, but every (p-1)-path is packed into a single
+        integer by concatenating the bits of its node ids, such that all boundaries
+        are looked up at once by a binary search.
+
+        Parameters
+        ----------
+        rank : int
+            The rank of the elementary p-paths, must be at least 1.
+
+        Returns
+        -------
+        np.ndarray or None
+            Array of shape (n_paths, rank + 1). The entry (j, i) is the index of the
+            boundary path obtained by deleting the i-th node of the j-th path, or -1
+            if that boundary is not part of the complex. None if the packed paths do
+            not fit into 63 bits.
+        """
+        width = max(len(self._path_set.faces_dict[0]) - 1, 1).bit_length()
+        if width * rank > 63:
+            return None
+        shifts = width * np.arange(rank - 1, -1, -1, dtype=np.int64)
+
+        paths, faces, node_order = self._paths_as_node_ids(rank)
+        if len(faces) == 0:
+            return np.full(paths.shape, -1, dtype=np.int32)
+        # fixed-width packing preserves the lexicographic order of the paths
+        face_keys = np.bitwise_or.reduce(faces << shifts, axis=1)
+        face_perm = np.argsort(face_keys).astype(np.int32)
+        face_keys = face_keys[face_perm]
+
+        idx_boundary = np.empty(paths.shape, dtype=np.int32)
+        for i in range(rank + 1):
+            boundary_paths = np.delete(paths, i, axis=1)
+            if not self._reserve_sequence_order and rank > 1:
+                mask = (
+                    node_order[boundary_paths[:, 0]] > node_order[boundary_paths[:, -1]]
+                )
+                boundary_paths[mask] = boundary_paths[mask, ::-1]
+            keys = np.bitwise_or.reduce(boundary_paths << shifts, axis=1)
+            pos = np.searchsorted(face_keys, keys)
+            pos[pos == len(face_keys)] = 0
+            found = face_keys[pos] == keys
+            idx_boundary[:, i] = np.where(found, face_perm[pos], -1)
+        return idx_boundary
 
     def up_laplacian_matrix(
         self,
@@ -499,7 +714,7 @@ class PathComplex(Complex):
         signed: bool = True,
         weight: str | None = None,
         index: bool = False,
-    ) -> tuple[dict, sp.sparse.lil_matrix] | sp.sparse.lil_matrix:
+    ) -> tuple[dict, sp.sparse.csr_matrix] | sp.sparse.csr_matrix:
         """Compute up laplacian matrix of the path complex.
 
         Parameters
@@ -515,28 +730,30 @@ class PathComplex(Complex):
 
         Returns
         -------
-        tuple[dict, sp.sparse.lil_matrix] | sp.sparse.lil_matrix
+        tuple[dict, sp.sparse.csr_matrix] | sp.sparse.csr_matrix
             If `index` is True, return a tuple of (idx_p, up_laplacian_matrix) otherwise
             if `index` is False, return up_laplacian_matrix.
         """
         if weight is not None:
             raise ValueError("Weighted Laplacian is not supported in this version.")
 
-        if 0 <= rank < self.dim:
-            row, col, B_next = self.incidence_matrix(
-                rank + 1, weight=weight, index=True
-            )
-            L_up = B_next @ B_next.transpose()
-        else:
+        if not 0 <= rank < self.dim:
             raise ValueError(
                 f"Rank should larger than 0 and <= {self.dim - 1} (maximal dimension-1), got {rank}."
             )
-        if not signed:
-            L_up = abs(L_up)
+
+        key = ("up", rank, signed)
+        if key not in self._laplacian_cache:
+            B_next = self.incidence_matrix(rank + 1, weight=weight)
+            L_up = B_next @ B_next.T
+            if not signed:
+                L_up = _abs_inplace(L_up)
+            self._laplacian_cache[key] = L_up.tocsr()
+        L_up = self._laplacian_cache[key]
 
         if index:
-            return row, L_up.tolil()
-        return L_up.tolil()
+            return self._path2idx(rank).copy(), L_up.copy()
+        return L_up.copy()
 
     def down_laplacian_matrix(
         self,
@@ -544,7 +761,7 @@ class PathComplex(Complex):
         signed: bool = True,
         weight: str | None = None,
         index: bool = False,
-    ) -> tuple[dict, sp.sparse.lil_matrix] | sp.sparse.lil_matrix:
+    ) -> tuple[dict, sp.sparse.csr_matrix] | sp.sparse.csr_matrix:
         """Compute down laplacian matrix of the path complex.
 
         Parameters
@@ -560,25 +777,30 @@ class PathComplex(Complex):
 
         Returns
         -------
-        tuple[dict, sp.sparse.lil_matrix] | sp.sparse.lil_matrix
+        tuple[dict, sp.sparse.csr_matrix] | sp.sparse.csr_matrix
             If `index` is True, return a tuple of (idx_p, down_laplacian_matrix) otherwise
             if `index` is False, return down_laplacian_matrix.
         """
         if weight is not None:
             raise ValueError("Weighted Laplacian is not supported in this version.")
 
-        if self.dim >= rank > 0:
-            row, column, B = self.incidence_matrix(rank, weight=weight, index=True)
-            L_down = B.transpose() @ B
-        else:
+        if not self.dim >= rank > 0:
             raise ValueError(
                 f"Rank should be larger than 1 and <= {self.dim} (maximal dimension), got {rank}."
             )
-        if not signed:
-            L_down = abs(L_down)
+
+        key = ("down", rank, signed)
+        if key not in self._laplacian_cache:
+            B = self.incidence_matrix(rank, weight=weight)
+            L_down = B.T @ B
+            if not signed:
+                L_down = _abs_inplace(L_down)
+            self._laplacian_cache[key] = L_down.tocsr()
+        L_down = self._laplacian_cache[key]
+
         if index:
-            return row, L_down.tolil()
-        return L_down.tolil()
+            return self._path2idx(rank - 1).copy(), L_down.copy()
+        return L_down.copy()
 
     def hodge_laplacian_matrix(
         self,
@@ -605,39 +827,25 @@ class PathComplex(Complex):
         tuple[dict, sp.sparse.lil_matrix] | sp.sparse.lil_matrix
             When index is True, return a tuple of (idx_p, Laplacian) else return Laplacian.
         """
-        if rank == 0:
-            row, column, B_next = self.incidence_matrix(
-                rank + 1, weight=weight, index=True
-            )
-            L_hodge = B_next @ B_next.transpose()
-            if not signed:
-                L_hodge = abs(L_hodge)
-            if index:
-                return row, L_hodge
-            return L_hodge
-        if rank < self.dim:
-            row, column, B_next = self.incidence_matrix(
-                rank + 1, weight=weight, index=True
+        if not 0 <= rank <= self.dim:
+            raise ValueError(
+                f"Rank should be larger than 0 and <= {self.dim} (maximal dimension simplices), got {rank}"
             )
-            row, column, B = self.incidence_matrix(rank, weight=weight, index=True)
-            L_hodge = B_next @ B_next.transpose() + B.transpose() @ B
-            if not signed:
-                L_hodge = abs(L_hodge)
-            if index:
-                return column, L_hodge
-            return L_hodge
-        if rank == self.dim:
-            row, column, B = self.incidence_matrix(rank, weight=weight, index=True)
-            L_hodge = B.transpose() @ B
-            if not signed:
-                L_hodge = abs(L_hodge)
-            if index:
-                return column, L_hodge
-            return L_hodge
 
-        raise ValueError(
-            f"Rank should be larger than 0 and <= {self.dim} (maximal dimension simplices), got {rank}"
-        )
+        # reuse the (cached) signed up and down Laplacians; the absolute value has to
+        # be taken of their sum, not of the summands
+        if rank < self.dim:
+            row, L_hodge = self.up_laplacian_matrix(rank, index=True)
+            if rank > 0:
+                L_hodge += self.down_laplacian_matrix(rank)
+        else:
+            L_hodge = self.down_laplacian_matrix(rank)
+            row = self._path2idx(rank).copy()
+        if not signed:
+            L_hodge = _abs_inplace(L_hodge)
+        if index:
+            return row, L_hodge
+        return L_hodge
 
     def adjacency_matrix(
         self,
@@ -645,7 +853,7 @@ class PathComplex(Complex):
         signed: bool = False,
         weight: str | None = None,
         index: bool = False,
-    ) -> tuple[dict, sp.sparse.lil_matrix] | sp.sparse.lil_matrix:
+    ) -> tuple[dict, sp.sparse.csr_matrix] | sp.sparse.csr_matrix:
         """Compute adjacency matrix of the path complex.
 
         Parameters
@@ -661,14 +869,15 @@ class PathComplex(Complex):
 
         Returns
         -------
-        tuple[dict, sp.sparse.lil_matrix] | sp.sparse.lil_matrix
+        tuple[dict, sp.sparse.csr_matrix] | sp.sparse.csr_matrix
             If `index` is True, return a tuple of (idx_p, adjacency_matrix) else return adjacency_matrix.
         """
         ind, L_up = self.up_laplacian_matrix(rank, signed=signed, index=True)
         L_up.setdiag(0)
+        L_up.eliminate_zeros()
 
         if not signed:
-            L_up = abs(L_up)
+            L_up = _abs_inplace(L_up)
         if index:
             return ind, L_up
         return L_up
@@ -679,7 +888,7 @@ class PathComplex(Complex):
         signed: bool = False,
         weight: str | None = None,
         index: bool = False,
-    ) -> tuple[dict, sp.sparse.lil_matrix] | sp.sparse.lil_matrix:
+    ) -> tuple[dict, sp.sparse.csr_matrix] | sp.sparse.csr_matrix:
         """Compute coadjacency matrix of the path complex.
 
         Parameters
@@ -695,13 +904,14 @@ class PathComplex(Complex):
 
         Returns
         -------
-        tuple[dict, sp.sparse.lil_matrix] | sp.sparse.lil_matrix
+        tuple[dict, sp.sparse.csr_matrix] | sp.sparse.csr_matrix
             If `index` is True, return a tuple of (idx_p, coadjacency_matrix) else return coadjacency_matrix.
         """
         ind, L_down = self.down_laplacian_matrix(rank, signed=signed, index=True)
         L_down.setdiag(0)
+        L_down.eliminate_zeros()
         if not signed:
-            L_down = abs(L_down)
+            L_down = _abs_inplace(L_down)
         if index:
             return ind, L_down
         return L_down
@@ -1044,7 +1254,8 @@ class PathComplex(Complex):
             The path to be removed.
         """
         del self._path_set.faces_dict[len(path) - 1][path]
-        self._allowed_paths.remove(path)
+        self._allowed_paths.discard(path)
+        self._invalidate_caches(len(path) - 1)
         if (
             len(self._path_set.faces_dict[len(path) - 1]) == 0
             and self._path_set.max_dim == len(path) - 1
@@ -1078,10 +1289,71 @@ class PathComplex(Complex):
             The return value.
         """
         dim = len(path) - 1
-        if path not in self._path_set.faces_dict[dim]:  # Not in faces_dict
-            self._path_set.faces_dict[dim][path] = {}
-            return path
-        return None
+        faces = self._path_set.faces_dict[dim]
+        n_faces = len(faces)
+        faces.setdefault(path, {})  # single lookup; the size tells if path is new
+        if len(faces) == n_faces:  # already in faces_dict
+            return None
+        self._invalidate_caches(dim)
+        return path
+
+    def _node_key(self, node: Hashable) -> str:
+        """Return the key of a node used to canonicalize elementary p-paths.
+
+        Elementary p-paths are oriented such that the key of the first node is not
+        larger than the key of the last node. The key of a node is its string
+        representation, which is computed once per node and cached.
+
+        Parameters
+        ----------
+        node : Hashable
+            A node of the path complex.
+
+        Returns
+        -------
+        str
+            The key of the node.
+        """
+        return self._node_keys[node]
+
+    def _invalidate_caches(self, rank: int) -> None:
+        """Invalidate the cached skeleton and path2idx dict of the given rank.
+
+        The cached boundaries of this rank and the next one are invalidated as
+        well, cached Laplacians regardless of their rank.
+
+        Parameters
+        ----------
+        rank : int
+            The rank whose elementary p-paths have been modified.
+        """
+        self._skeleton_cache.pop(rank, None)
+        self._path2idx_cache.pop(rank, None)
+        self._boundary_cache.pop(rank, None)
+        self._boundary_cache.pop(rank + 1, None)
+        self._laplacian_cache.clear()
+
+    def _path2idx(self, rank: int) -> dict[tuple[Hashable], int]:
+        """Return the mapping of elementary p-paths of a rank to their index.
+
+        The indices correspond to the position of the path in `skeleton(rank)`. The
+        returned dict is cached and must not be modified by the caller.
+
+        Parameters
+        ----------
+        rank : int
+            The rank of the elementary p-paths.
+
+        Returns
+        -------
+        dict[tuple[Hashable], int]
+            The path2idx dict of the given rank.
+        """
+        if rank not in self._path2idx_cache:
+            self._path2idx_cache[rank] = {
+                path: i for i, path in enumerate(self.skeleton(rank))
+            }
+        return self._path2idx_cache[rank]
 
     def _update_attributes(self, path, **attr):
         """Update the attributes of path.
@@ -1158,7 +1430,7 @@ class PathComplex(Complex):
         int
             The number of elementary p-paths in the path complex.
         """
-        return len(list(self.__iter__()))
+        return len(self._path_set)
 
     def __str__(self) -> str:
         """Return detailed string representation.
@@ -1212,36 +1484,26 @@ class PathComplex(Complex):
         >>> allowed_paths
         {(0, 1), (1, 3), (1, 2), (2,), (1, 3, 2), (0, 1, 2), (0, 1, 3), (1, 2, 3), (2, 1, 3), (2, 3), (1,), (0,), (3,)}
         """
-        allowed_paths = []
-        all_nodes_list = [(node,) for node in sorted(graph.nodes, key=str)]
-        all_edges_list = []
+        node_keys = {node: str(node) for node in graph.nodes}
+        allowed_paths = {(node,) for node in graph.nodes}
         for edge in graph.edges:
-            if not reserve_sequence_order and str(edge[0]) > str(edge[1]):
+            if not reserve_sequence_order and node_keys[edge[0]] > node_keys[edge[1]]:
                 edge = edge[::-1]
-            all_edges_list.append(edge)
-        allowed_paths.extend(all_nodes_list)
-        allowed_paths.extend(all_edges_list)
+            allowed_paths.add(tuple(edge))
 
+        # a single depth-first search per source collects the simple paths to all
+        # nodes that come after the source in the node order
         node_ls = list(graph.nodes)
-        for src_idx in range(len(node_ls)):
-            for tgt_idx in range(src_idx + 1, len(node_ls)):
-                all_simple_paths = list(
-                    nx.all_simple_paths(
-                        graph,
-                        source=node_ls[src_idx],
-                        target=node_ls[tgt_idx],
-                        cutoff=max_rank,
-                    )
-                )
-
-                for i in range(len(all_simple_paths)):
-                    path = all_simple_paths[i]
-                    if not reserve_sequence_order:
-                        all_simple_paths[i] = (
-                            path[::-1] if str(path[0]) > str(path[-1]) else path
-                        )
-                    all_simple_paths[i] = tuple(all_simple_paths[i])
-
-                if len(all_simple_paths) > 0:
-                    allowed_paths.extend(all_simple_paths)
-        return set(allowed_paths)
+        for src_idx in range(len(node_ls) - 1):
+            for path in nx.all_simple_paths(
+                graph,
+                source=node_ls[src_idx],
+                target=set(node_ls[src_idx + 1 :]),
+                cutoff=max_rank,
+            ):
+                if not reserve_sequence_order and (
+                    node_keys[path[0]] > node_keys[path[-1]]
+                ):
+                    path = path[::-1]
+                allowed_paths.add(tuple(path))
+        return allowed_paths
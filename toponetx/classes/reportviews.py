@@ -852,11 +852,10 @@ class SimplexView(AtomView[Simplex]):
             simplex = frozenset({simplex})
 
         simplex = frozenset(simplex)
-        if (
-            len(self.faces_dict) >= len(simplex)
-            and simplex in self.faces_dict[len(simplex) - 1]
-        ):
-            return self.faces_dict[len(simplex) - 1][simplex]
+        if len(self.faces_dict) >= len(simplex):
+            attributes = self.faces_dict[len(simplex) - 1].get(simplex)
+            if attributes is not None:
+                return attributes
 
         raise KeyError(f"input {simplex} is not in the simplex dictionary")
 
@@ -879,7 +878,7 @@ class SimplexView(AtomView[Simplex]):
         int
             Returns the number of simplices in the SimplexView instance.
         """
-        return sum(self.shape)
+        return sum(map(len, self.faces_dict))
 
     def __iter__(self) -> Iterator:
         """Return an iterator over all simplices in the simplex view.
@@ -944,10 +943,7 @@ class SimplexView(AtomView[Simplex]):
         str
             Returns the __repr__ representation of the object.
         """
-        all_simplices: list[tuple[int, ...]] = []
-        for i in range(len(self.faces_dict)):
-            all_simplices += [tuple(j) for j in self.faces_dict[i]]
-
+        all_simplices = [tuple(simplex) for simplex in self]
         return f"SimplexView({all_simplices})"
 
     def __str__(self) -> str:
@@ -958,10 +954,7 @@ class SimplexView(AtomView[Simplex]):
         str
             Returns the __str__ representation of the object.
         """
-        all_simplices: list[tuple[int, ...]] = []
-        for i in range(len(self.faces_dict)):
-            all_simplices += [tuple(j) for j in self.faces_dict[i]]
-
+        all_simplices = [tuple(simplex) for simplex in self]
         return f"SimplexView({all_simplices})"
 
 
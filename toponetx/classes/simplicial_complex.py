@@ -4,22 +4,29 @@ The class also supports attaching arbitrary attributes and data to cells.
 """
 
 from collections.abc import Collection, Hashable, Iterable, Iterator
-from itertools import combinations
-from typing import Any
+from itertools import chain, combinations
+from typing import TYPE_CHECKING, Any
 
 import networkx as nx
 import numpy as np
-from scipy.sparse import csr_matrix, dok_matrix
+from scipy.sparse import (
+    coo_matrix,
+    csc_matrix,
+    csr_matrix,
+    diags,
+    issparse,
+    spmatrix,
+)
 from typing_extensions import Self, deprecated
 
 from toponetx.classes.complex import Complex
 from toponetx.classes.reportviews import NodeView, SimplexView
 from toponetx.classes.simplex import Simplex
+from toponetx.utils.structure import _abs_inplace
 
-try:
+if TYPE_CHECKING:
     from gudhi import SimplexTree
-except ImportError:
-    SimplexTree = None
+    from scipy.sparse.linalg import LinearOperator
 
 try:
     from hypernetx import Hypergraph
@@ -29,6 +36,53 @@ except ImportError:
 __all__ = ["SimplicialComplex"]
 
 
+def _clear_diagonal_inplace(matrix: csr_matrix) -> csr_matrix:
+    """Set the stored diagonal entries of a CSR matrix to zero, in place.
+
+    Unlike `setdiag(0)`, this does not insert explicit zeros for missing diagonal
+    entries and hence never changes the sparsity structure of the matrix.
+
+    Parameters
+    ----------
+    matrix : scipy.sparse.csr_matrix
+        The matrix to modify.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        The given matrix.
+    """
+    rows = np.repeat(
+        np.arange(matrix.shape[0], dtype=matrix.indices.dtype), np.diff(matrix.indptr)
+    )
+    matrix.data[matrix.indices == rows] = 0
+    return matrix
+
+
+def _copy_signed(matrix: spmatrix, signed: bool) -> spmatrix:
+    """Copy a cached signed sparse matrix, optionally dropping its signs.
+
+    For the unsigned copy the absolute values are written directly into the new
+    data array, instead of copying the data first and taking the absolute values
+    in a second pass.
+
+    Parameters
+    ----------
+    matrix : scipy.sparse.spmatrix
+        A sparse matrix in a compressed format, i.e., CSR or CSC.
+    signed : bool
+        Whether to keep the signs of the entries.
+
+    Returns
+    -------
+    scipy.sparse.spmatrix
+        A copy of the matrix that shares no buffers with it.
+    """
+    if signed:
+        return matrix.copy()
+    return matrix._with_data(np.abs(matrix.data))
+
+
 class SimplicialComplex(Complex):
     """Class representing a simplicial complex.
 
@@ -111,6 +165,16 @@ class SimplicialComplex(Complex):
         super().__init__(**kwargs)
 
         self._simplex_set = SimplexView()
+        # sorted skeletons per rank, cleared on modification
+        self._skeleton_cache: dict[int, list[tuple[Hashable, ...]]] = {}
+        # signed incidence matrices and their indices per rank, cleared on modification
+        self._incidence_cache: dict[int, tuple[dict, dict, csc_matrix]] = {}
+        # signed (co)adjacency matrices and their indices per rank, cleared on
+        # modification
+        self._adjacency_cache: dict[int, tuple[dict, csr_matrix]] = {}
+        self._coadjacency_cache: dict[int, tuple[dict, csr_matrix]] = {}
+        # simplices per rank as arrays of node indices, cleared on modification
+        self._simplex_array_cache: dict[int, np.ndarray] = {}
 
         if isinstance(simplices, nx.Graph):
             _simplices: dict[tuple, Any] = {}
@@ -225,9 +289,12 @@ class SimplicialComplex(Complex):
         >>> SC.is_maximal([1, 2])
         False
         """
-        if simplex not in self.simplices:
-            raise ValueError(f"Simplex {simplex} is not in the simplicial complex.")
-        return self[simplex]["is_maximal"]
+        try:
+            return self._simplex_set[simplex]["is_maximal"]
+        except KeyError:
+            raise ValueError(
+                f"Simplex {simplex} is not in the simplicial complex."
+            ) from None
 
     def get_maximal_simplices_of_simplex(
         self, simplex: Iterable[Hashable]
@@ -260,7 +327,11 @@ class SimplicialComplex(Complex):
             Simplices of rank `rank` in the simplicial complex.
         """
         if len(self._simplex_set.faces_dict) > rank >= 0:
-            return sorted(tuple(sorted(i)) for i in self._simplex_set.faces_dict[rank])
+            if rank not in self._skeleton_cache:
+                self._skeleton_cache[rank] = sorted(
+                    tuple(sorted(i)) for i in self._simplex_set.faces_dict[rank]
+                )
+            return self._skeleton_cache[rank].copy()
         if rank < 0:
             raise ValueError(f"input must be a postive integer, got {rank}")
         raise ValueError(f"input {rank} exceeds max dim")
@@ -294,7 +365,9 @@ class SimplicialComplex(Complex):
         int
             Number of vertices in the complex.
         """
-        return len(self.skeleton(0))
+        if len(self._simplex_set.faces_dict) == 0:
+            return 0
+        return len(self._simplex_set.faces_dict[0])
 
     def __getitem__(self, atom: Any) -> dict[Hashable, Any]:
         """Get the data associated with the given simplex.
@@ -324,7 +397,7 @@ class SimplicialComplex(Complex):
         Iterator[frozenset[Hashable]]
             An iterator over all simplices in the simplicial complex.
         """
-        return iter(self.simplices)
+        return chain.from_iterable(self._simplex_set.faces_dict)
 
     def __contains__(self, atom: Any) -> bool:
         """Check whether this simplicial complex contains the given atom.
@@ -341,6 +414,14 @@ class SimplicialComplex(Complex):
         """
         return atom in self._simplex_set
 
+    def _invalidate_caches(self) -> None:
+        """Invalidate all cached matrices after the simplices have been modified."""
+        self._skeleton_cache.clear()
+        self._incidence_cache.clear()
+        self._adjacency_cache.clear()
+        self._coadjacency_cache.clear()
+        self._simplex_array_cache.clear()
+
     def _update_faces_dict_length(self, simplex) -> None:
         """Update the faces dictionary length based on the input simplex.
 
@@ -423,15 +504,13 @@ class SimplicialComplex(Complex):
             )
 
         face_set = set()
+        end = min_dim if min_dim is not None else 0
         for simplex in simplices:
             start = (
                 min(max_dim + 1, len(simplex)) if max_dim is not None else len(simplex)
             )
-            end = min_dim if min_dim is not None else 0
-
             for r in range(start, end, -1):
-                for face in combinations(simplex, r):
-                    face_set.add(frozenset(face))
+                face_set.update(map(frozenset, combinations(simplex, r)))
 
         return face_set
 
@@ -464,6 +543,7 @@ class SimplicialComplex(Complex):
                 simplex_ = simplex.elements
         if simplex_ in self._simplex_set.faces_dict[len(simplex_) - 1]:
             if self.is_maximal(simplex):
+                self._invalidate_caches()
                 del self._simplex_set.faces_dict[len(simplex_) - 1][simplex_]
                 faces = self.get_boundaries([simplex_])
                 for s in faces:
@@ -588,6 +668,7 @@ class SimplicialComplex(Complex):
             self._simplex_set.faces_dict[len(elements) - 1][elements].update(kwargs)
             return
 
+        self._invalidate_caches()
         self._update_faces_dict_length(elements)
 
         if self._simplex_set.max_dim < len(simplex) - 1:
@@ -628,14 +709,13 @@ class SimplicialComplex(Complex):
         list of tuples
             The cofaces of the given simplex.
         """
+        simplex = frozenset(simplex)
+        # only enumerate the faces that are large enough to be cofaces
         entire_tree = self.get_boundaries(
-            self.get_maximal_simplices_of_simplex(simplex)
+            self.get_maximal_simplices_of_simplex(simplex),
+            min_dim=max(len(simplex) + codimension - 1, 0),
         )
-        return [
-            i
-            for i in entire_tree
-            if frozenset(simplex).issubset(i) and len(i) - len(simplex) >= codimension
-        ]
+        return [i for i in entire_tree if simplex.issubset(i)]
 
     def get_star(self, simplex) -> list[frozenset]:
         """Get star.
@@ -768,9 +848,10 @@ class SimplicialComplex(Complex):
         """
         if rank is None:
             return {
-                n: self.simplices[n][name]
-                for n in self.simplices
-                if name in self.simplices[n]
+                simplex: attributes[name]
+                for faces in self._simplex_set.faces_dict
+                for simplex, attributes in faces.items()
+                if name in attributes
             }
         return {
             n: self.simplices[n][name] for n in self.skeleton(rank) if name in self[n]
@@ -783,7 +864,7 @@ class SimplicialComplex(Complex):
         Parameters
         ----------
         matrix : numpy or scipy array
-            The matrix to get the edges from.
+            The matrix to get the edges from. Sparse matrices are not densified.
 
         Returns
         -------
@@ -801,12 +882,18 @@ class SimplicialComplex(Complex):
         This property implies that many computations on simplicial complexes
         can be reduced to G computations.
         """
-        rows, cols = np.where(np.sign(np.abs(matrix)) > 0)
+        if issparse(matrix):
+            matrix = coo_matrix(matrix)
+            matrix.sum_duplicates()
+            nonzero = matrix.data != 0
+            rows, cols = matrix.row[nonzero], matrix.col[nonzero]
+        else:
+            rows, cols = np.nonzero(matrix)
         return zip(rows.tolist(), cols.tolist(), strict=True)
 
     def incidence_matrix(
         self, rank, signed: bool = True, weight: str | None = None, index: bool = False
-    ) -> csr_matrix | tuple[dict, dict, csr_matrix]:
+    ) -> csc_matrix | tuple[dict, dict, csc_matrix]:
         """Compute incidence matrix of the simplicial complex.
 
         Getting the matrix that correpodnds to the boundary matrix of the input SC.
@@ -828,7 +915,7 @@ class SimplicialComplex(Complex):
         row_indices, col_indices : dict
             Dictionary assigning each row and column of the incidence matrix to a
             simplex. Only returned if `index` is True.
-        incidence_matrix : scipy.sparse.csr.csr_matrix
+        incidence_matrix : scipy.sparse.csc_matrix
             The incidence matrix.
 
         Raises
@@ -852,60 +939,198 @@ class SimplicialComplex(Complex):
                 f"Rank cannot be larger than the dimension of the complex, got {rank}."
             )
 
+        simplex_dict_d_minus_1, simplex_dict_d, boundary = self._incidence(rank)
+
+        boundary = _copy_signed(boundary, signed)
+        if index:
+            return simplex_dict_d_minus_1.copy(), simplex_dict_d.copy(), boundary
+        return boundary
+
+    def _incidence(self, rank: int) -> tuple[dict, dict, csc_matrix]:
+        """Return the cached signed incidence matrix of a rank together with its indices.
+
+        The returned objects are shared with the cache and must not be modified.
+
+        Parameters
+        ----------
+        rank : int
+            The rank of the incidence matrix, must be a valid rank of the complex.
+
+        Returns
+        -------
+        row_indices, col_indices : dict
+            Dictionary assigning each row and column of the incidence matrix to a
+            simplex.
+        incidence_matrix : scipy.sparse.csc_matrix
+            The signed incidence matrix.
+        """
+        if rank not in self._incidence_cache:
+            self._incidence_cache[rank] = self._compute_incidence_matrix(rank)
+        return self._incidence_cache[rank]
+
+    def _compute_incidence_matrix(self, rank: int) -> tuple[dict, dict, csc_matrix]:
+        """Compute the signed incidence matrix of a rank together with its indices.
+
+        Parameters
+        ----------
+        rank : int
+            The rank of the incidence matrix, must be a valid rank of the complex.
+
+        Returns
+        -------
+        row_indices, col_indices : dict
+            Dictionary assigning each row and column of the incidence matrix to a
+            simplex.
+        incidence_matrix : scipy.sparse.csc_matrix
+            The signed incidence matrix.
+        """
         if rank == 0:
-            boundary = dok_matrix(
-                (1, len(self._simplex_set.faces_dict[rank].items())), dtype=np.float32
+            n_nodes = len(self._simplex_set.faces_dict[0])
+            boundary = csc_matrix(
+                (
+                    np.ones(n_nodes, dtype=np.float32),
+                    np.zeros(n_nodes, dtype=np.int32),
+                    np.arange(n_nodes + 1, dtype=np.int32),
+                ),
+                shape=(1, n_nodes),
             )
-            boundary[0, 0 : len(self._simplex_set.faces_dict[rank].items())] = 1
-
-            if index:
-                simplex_dict_d = {
-                    simplex: i for i, simplex in enumerate(self.skeleton(0))
-                }
-                return {}, simplex_dict_d, boundary.tocsr()
-            return boundary.tocsr()
 
-        idx_simplices, idx_faces, values = [], [], []
+            simplex_dict_d = {simplex: i for i, simplex in enumerate(self.skeleton(0))}
+            return {}, simplex_dict_d, boundary
 
         simplex_dict_d = {simplex: i for i, simplex in enumerate(self.skeleton(rank))}
         simplex_dict_d_minus_1 = {
             simplex: i for i, simplex in enumerate(self.skeleton(rank - 1))
         }
-        for simplex, idx_simplex in simplex_dict_d.items():
-            for i, left_out in enumerate(np.sort(list(simplex))):
-                idx_simplices.append(idx_simplex)
-                values.append((-1) ** i)
-                face = frozenset(simplex).difference({left_out})
-                idx_faces.append(simplex_dict_d_minus_1[tuple(sorted(face))])
-
-        if len(values) != (rank + 1) * len(simplex_dict_d):
-            raise RuntimeError("Error in computing the incidence matrix.")
-
-        boundary = csr_matrix(
-            (values, (idx_faces, idx_simplices)),
-            dtype=np.float32,
+
+        simplices = self._simplex_array(rank)
+        faces = self._simplex_array(rank - 1)
+
+        # the i-th face of each simplex is obtained by leaving out its i-th node;
+        # leaving out the nodes from last to first yields the faces in ascending
+        # order, so each row below holds the sorted row indices of one column
+        positions = range(rank, -1, -1)
+        width = max(len(self._simplex_set.faces_dict[0]) - 1, 1).bit_length()
+        if width * rank <= 63:
+            # pack each face into a single integer; the faces are sorted
+            # lexicographically, hence so are their keys
+            face_keys = self._pack_simplices(faces, width)
+            idx_faces = np.stack(
+                [
+                    np.searchsorted(
+                        face_keys,
+                        self._pack_simplices(np.delete(simplices, i, axis=1), width),
+                    )
+                    for i in positions
+                ],
+                axis=1,
+            )
+        else:
+            face_index = {face: i for i, face in enumerate(map(tuple, faces.tolist()))}
+            idx_faces = np.stack(
+                [
+                    np.fromiter(
+                        map(
+                            face_index.__getitem__,
+                            map(tuple, np.delete(simplices, i, axis=1).tolist()),
+                        ),
+                        dtype=np.int64,
+                        count=len(simplices),
+                    )
+                    for i in positions
+                ],
+                axis=1,
+            )
+        signs = np.where(np.array(positions) % 2 == 0, 1, -1).astype(np.float32)
+
+        # every column holds exactly `rank + 1` entries
+        boundary = csc_matrix(
+            (
+                np.tile(signs, len(simplices)),
+                idx_faces.ravel(),
+                np.arange(0, (len(simplices) + 1) * (rank + 1), rank + 1),
+            ),
             shape=(
                 len(simplex_dict_d_minus_1),
                 len(simplex_dict_d),
             ),
         )
 
-        if index:
-            if signed:
-                return (
-                    simplex_dict_d_minus_1,
-                    simplex_dict_d,
-                    boundary,
-                )
-            return (
-                simplex_dict_d_minus_1,
-                simplex_dict_d,
-                abs(boundary),
+        return simplex_dict_d_minus_1, simplex_dict_d, boundary
+
+    def _simplex_array(self, rank: int) -> np.ndarray:
+        """Return the simplices of a rank as an array of node indices.
+
+        Nodes are represented by their index in the sorted 0-skeleton, which keeps
+        the nodes of each simplex in ascending order and the rows in the order of
+        `skeleton(rank)`. The array is cached and must not be modified.
+
+        Parameters
+        ----------
+        rank : int
+            The rank of the simplices, must be a valid rank of the complex.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n_simplices, rank + 1) whose rows hold the indices of the
+            nodes of each simplex.
+        """
+        if rank not in self._simplex_array_cache:
+            node_index = {node: i for i, (node,) in enumerate(self.skeleton(0))}
+            self._simplex_array_cache[rank] = self._skeleton_as_array(
+                self.skeleton(rank), node_index
             )
+        return self._simplex_array_cache[rank]
 
-        if signed:
-            return boundary
-        return abs(boundary)
+    @staticmethod
+    def _skeleton_as_array(
+        simplices: Iterable[tuple[Hashable, ...]], node_index: dict[Hashable, int]
+    ) -> np.ndarray:
+        """Stack simplices of the same rank as an array of node indices.
+
+        Parameters
+        ----------
+        simplices : Iterable[tuple[Hashable, ...]]
+            The simplices to stack, all of the same rank and non-empty.
+        node_index : dict[Hashable, int]
+            Mapping of each node to its index.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n_simplices, rank + 1) whose rows hold the indices of the
+            nodes of each simplex.
+        """
+        simplices = list(simplices)
+        return np.fromiter(
+            map(node_index.__getitem__, chain.from_iterable(simplices)),
+            dtype=np.int32,
+            count=len(simplices) * len(simplices[0]),
+        ).reshape(len(simplices), -1)
+
+    @staticmethod
+    def _pack_simplices(simplices: np.ndarray, width: int) -> np.ndarray:
+        """Pack each row of node indices into a single integer key.
+
+        Parameters
+        ----------
+        simplices : np.ndarray
+            Array of shape (n_simplices, k) holding node indices.
+        width : int
+            Number of bits reserved for each node index. `width * k` must not
+            exceed 63.
+
+        Returns
+        -------
+        np.ndarray
+            The keys of the rows. Keys compare like the rows they encode.
+        """
+        keys = np.zeros(len(simplices), dtype=np.int64)
+        for column in simplices.T:
+            keys <<= width
+            keys |= column
+        return keys
 
     def coincidence_matrix(
         self, rank, signed: bool = True, weight=None, index: bool = False
@@ -977,38 +1202,85 @@ class SimplicialComplex(Complex):
         >>> SC.add_simplex([3, 4, 8])
         >>> L1 = SC.hodge_laplacian_matrix(1)
         """
-        if rank == 0:
-            row, column, B_next = self.incidence_matrix(
-                rank + 1, weight=weight, index=True
+        if not 0 <= rank <= self.dim or self.dim == 0:
+            raise ValueError(
+                f"Rank should be larger than 0 and <= {self.dim} (maximal dimension simplices), got {rank}"
             )
-            L_hodge = B_next @ B_next.transpose()
-            if not signed:
-                L_hodge = abs(L_hodge)
-            if index:
-                return row, L_hodge
-            return L_hodge
+
         if rank < self.dim:
-            row, column, B_next = self.incidence_matrix(
-                rank + 1, weight=weight, index=True
-            )
-            row, column, B = self.incidence_matrix(rank, weight=weight, index=True)
-            L_hodge = B_next @ B_next.transpose() + B.transpose() @ B
-            if not signed:
-                L_hodge = abs(L_hodge)
-            if index:
-                return column, L_hodge
-            return L_hodge
-        if rank == self.dim:
-            row, column, B = self.incidence_matrix(rank, weight=weight, index=True)
+            simplex_dict_d, _, B_next = self._incidence(rank + 1)
+            # the product of the CSC incidence matrices is CSC; as it is symmetric,
+            # its transpose is the same matrix in CSR format at no cost
+            L_hodge = (B_next @ B_next.transpose()).transpose()
+            if rank > 0:
+                _, _, B = self._incidence(rank)
+                L_hodge += B.transpose() @ B
+        else:
+            _, simplex_dict_d, B = self._incidence(rank)
             L_hodge = B.transpose() @ B
-            if not signed:
-                L_hodge = abs(L_hodge)
-            if index:
-                return column, L_hodge
-            return L_hodge
-
-        raise ValueError(
-            f"Rank should be larger than 0 and <= {self.dim} (maximal dimension simplices), got {rank}"
+
+        if not signed:
+            _abs_inplace(L_hodge)
+        if index:
+            return simplex_dict_d.copy(), L_hodge
+        return L_hodge
+
+    def hodge_laplacian_operator(self, rank: int) -> "LinearOperator":
+        """Return the signed hodge-laplacian of the simplicial complex as a linear operator.
+
+        The operator computes matrix-vector products with the hodge laplacian
+        through the incidence matrices, i.e., `B_{k+1} (B_{k+1}^T x) + B_k^T (B_k x)`,
+        without forming the laplacian itself. This is the recommended input for
+        iterative eigensolvers such as `scipy.sparse.linalg.eigsh`, as it needs
+        less memory than the matrix whenever the laplacian has a large fill-in.
+
+        Parameters
+        ----------
+        rank : int
+            Dimension of the Laplacian operator.
+
+        Returns
+        -------
+        scipy.sparse.linalg.LinearOperator
+            The signed hodge laplacian of rank `rank`. Its rows and columns are
+            indexed like those of `hodge_laplacian_matrix`.
+
+        Raises
+        ------
+        ValueError
+            If the rank is negative or larger than the dimension of the simplicial
+            complex.
+
+        Examples
+        --------
+        >>> from scipy.sparse.linalg import eigsh
+        >>> SC = tnx.SimplicialComplex([[1, 2, 3], [2, 3, 5], [0, 1]])
+        >>> L1 = SC.hodge_laplacian_operator(1)
+        >>> eigenvalues = eigsh(L1, k=2, return_eigenvectors=False)
+        """
+        from scipy.sparse.linalg import LinearOperator
+
+        if not 0 <= rank <= self.dim or self.dim == 0:
+            raise ValueError(
+                f"Rank should be larger than 0 and <= {self.dim} (maximal dimension simplices), got {rank}"
+            )
+
+        # pairs (inner, outer) of factors with L = sum(outer @ inner); the
+        # transposes are cheap views of the cached incidence matrices
+        factors = []
+        if rank < self.dim:
+            _, _, B_next = self._incidence(rank + 1)
+            factors.append((B_next.transpose(), B_next))
+        if rank > 0:
+            _, _, B = self._incidence(rank)
+            factors.append((B, B.transpose()))
+
+        def matvec(x):
+            return sum(outer @ (inner @ x) for inner, outer in factors)
+
+        n = factors[0][0].shape[1]
+        return LinearOperator(
+            shape=(n, n), matvec=matvec, rmatvec=matvec, matmat=matvec, dtype=np.float32
         )
 
     def dirac_operator_matrix(
@@ -1077,11 +1349,11 @@ class SimplicialComplex(Complex):
 
             if signed:
                 return d, dirac_mat
-            return d, abs(dirac_mat)
+            return d, _abs_inplace(dirac_mat)
 
         if signed:
             return dirac_mat
-        return abs(dirac_mat)
+        return _abs_inplace(dirac_mat)
 
     def normalized_laplacian_matrix(self, rank: int, weight: str | None = None):
         """Return the normalized hodge Laplacian matrix of simplicial complex .
@@ -1112,20 +1384,15 @@ class SimplicialComplex(Complex):
         >>> SC = tnx.SimplicialComplex([[1, 2, 3], [2, 3, 5], [0, 1]])
         >>> SC.normalized_laplacian_matrix(1)
         """
-        import scipy as sp
-
         L_hodge = self.hodge_laplacian_matrix(rank)
-        m, n = L_hodge.shape
-        diags_ = abs(L_hodge).sum(axis=1)
+        diags_ = np.asarray(abs(L_hodge).sum(axis=1)).ravel()
 
         with np.errstate(divide="ignore"):
             diags_sqrt = 1.0 / np.sqrt(diags_)
         diags_sqrt[np.isinf(diags_sqrt)] = 0
-        diags_sqrt = sp.sparse.csr_array(
-            sp.sparse.spdiags(diags_sqrt.T, 0, m, n, format="csr")
-        )
+        diags_sqrt = diags(diags_sqrt)
 
-        return sp.sparse.csr_matrix(diags_sqrt @ (L_hodge @ diags_sqrt))
+        return (diags_sqrt @ L_hodge @ diags_sqrt).tocsr()
 
     def up_laplacian_matrix(
         self,
@@ -1165,19 +1432,17 @@ class SimplicialComplex(Complex):
             raise ValueError("`weight` is not supported in this version")
 
         if rank < self.dim and rank >= 0:
-            row, col, B_next = self.incidence_matrix(
-                rank + 1, weight=weight, index=True
-            )
-            L_up = B_next @ B_next.transpose()
+            row, _, B_next = self._incidence(rank + 1)
+            L_up = (B_next @ B_next.transpose()).transpose()
         else:
             raise ValueError(
                 f"Rank should larger than 0 and <= {self.dim - 1} (maximal dimension cells-1), got {rank}"
             )
         if not signed:
-            L_up = abs(L_up)
+            _abs_inplace(L_up)
 
         if index:
-            return row, L_up
+            return row.copy(), L_up
         return L_up
 
     def down_laplacian_matrix(
@@ -1209,16 +1474,16 @@ class SimplicialComplex(Complex):
             raise ValueError("`weight` is not supported in this version")
 
         if self.dim >= rank > 0:
-            row, column, B = self.incidence_matrix(rank, weight=weight, index=True)
+            _, column, B = self._incidence(rank)
             L_down = B.transpose() @ B
         else:
             raise ValueError(
                 f"Rank should be larger than 1 and <= {self.dim} (maximal dimension cells), got {rank}."
             )
         if not signed:
-            L_down = abs(L_down)
+            _abs_inplace(L_down)
         if index:
-            return column, L_down
+            return column.copy(), L_down
         return L_down
 
     def adjacency_matrix(
@@ -1258,17 +1523,44 @@ class SimplicialComplex(Complex):
         if weight is not None:
             raise ValueError("`weight` is not supported in this version")
 
-        ind, L_up = self.up_laplacian_matrix(
-            rank, signed=signed, weight=weight, index=True
-        )
-        L_up.setdiag(0)
+        if rank not in self._adjacency_cache:
+            if rank == 0 and self.dim > 0:
+                self._adjacency_cache[rank] = self._node_adjacency()
+            else:
+                ind, L_up = self.up_laplacian_matrix(rank, index=True)
+                self._adjacency_cache[rank] = ind, _clear_diagonal_inplace(L_up)
+        ind, L_up = self._adjacency_cache[rank]
 
-        if not signed:
-            L_up = abs(L_up)
+        L_up = _copy_signed(L_up, signed)
         if index:
-            return ind, L_up
+            return ind.copy(), L_up
         return L_up
 
+    def _node_adjacency(self) -> tuple[dict, csr_matrix]:
+        """Compute the signed adjacency matrix of the nodes directly from the edges.
+
+        Both nodes of an edge have opposite signs in the incidence matrix, hence all
+        entries of the signed node adjacency matrix are -1. This avoids computing
+        the up laplacian of rank 0.
+
+        Returns
+        -------
+        indices : dict
+            Dictionary assigning each row and column of the adjacency matrix to a
+            node.
+        adjacency_matrix : scipy.sparse.csr_matrix
+            The signed adjacency matrix of the nodes.
+        """
+        ind, _, _ = self._incidence(1)
+        edges = self._simplex_array(1)
+        rows = np.concatenate([edges[:, 0], edges[:, 1]])
+        cols = np.concatenate([edges[:, 1], edges[:, 0]])
+        adjacency = coo_matrix(
+            (np.full(len(rows), -1, dtype=np.float32), (rows, cols)),
+            shape=(len(ind), len(ind)),
+        ).tocsr()
+        return ind, adjacency
+
     def coadjacency_matrix(
         self, rank: int, signed: bool = False, weight=None, index: bool = False
     ):
@@ -1298,14 +1590,14 @@ class SimplicialComplex(Complex):
         if weight is not None:
             raise ValueError("`weight` is not supported in this version")
 
-        ind, L_down = self.down_laplacian_matrix(
-            rank, signed=signed, weight=weight, index=True
-        )
-        L_down.setdiag(0)
-        if not signed:
-            L_down = abs(L_down)
+        if rank not in self._coadjacency_cache:
+            ind, L_down = self.down_laplacian_matrix(rank, index=True)
+            self._coadjacency_cache[rank] = ind, _clear_diagonal_inplace(L_down)
+        ind, L_down = self._coadjacency_cache[rank]
+
+        L_down = _copy_signed(L_down, signed)
         if index:
-            return ind, L_down
+            return ind.copy(), L_down
         return L_down
 
     def add_elements_from_nx_graph(self, G: nx.Graph) -> None:
@@ -1316,8 +1608,7 @@ class SimplicialComplex(Complex):
         G : networkx.Graph
             A networkx graph instance.
         """
-        _simplices = [[n] for n in G.nodes] + list(G.edges)
-        self.add_simplices_from(_simplices)
+        self.add_simplices_from(chain(([n] for n in G.nodes), G.edges))
 
     def restrict_to_simplices(self, cell_set) -> Self:
         """Construct a simplicial complex using a subset of the simplices.
@@ -1343,7 +1634,8 @@ class SimplicialComplex(Complex):
         >>> SC1.simplices
         SimplexView([(1,), (2,), (3,), (4,), (1, 2), (1, 3), (2, 3), (2, 4), (1, 2, 3)])
         """
-        rns = [cell for cell in cell_set if cell in self.simplices]
+        simplices = self._simplex_set
+        rns = [cell for cell in cell_set if cell in simplices]
         return self.__class__(simplices=rns)
 
     def restrict_to_nodes(self, node_set):
@@ -1372,15 +1664,22 @@ class SimplicialComplex(Complex):
         SimplexView([(1,), (2,), (3,), (4,), (1, 2), (1, 3), (1, 4), (2, 3), (2, 4), (1, 2, 3), (1, 2, 4)])
         """
         node_set = set(node_set)
-        simplices = [
-            s
-            for rank in range(1, self.dim + 1)
-            for s in self.skeleton(rank)
-            if set(s).issubset(node_set)
-        ]
-        all_sim = simplices + [frozenset({i}) for i in node_set if i in self.nodes]
+        simplices = []
+        if self.dim >= 0:
+            # mask over the node indices used by the simplex arrays
+            nodes = self.skeleton(0)
+            selected = np.fromiter(
+                (node in node_set for (node,) in nodes), dtype=bool, count=len(nodes)
+            )
+            for rank in range(1, self.dim + 1):
+                keep = selected[self._simplex_array(rank)].all(axis=1)
+                skeleton = self.skeleton(rank)
+                simplices.extend(skeleton[i] for i in np.flatnonzero(keep).tolist())
+            # nodes go last, so that nodes of higher-rank simplices keep the order
+            # in which they are created by those simplices
+            simplices.extend(nodes[i] for i in np.flatnonzero(selected).tolist())
 
-        return SimplicialComplex(all_sim)
+        return SimplicialComplex(simplices)
 
     def get_all_maximal_simplices(self):
         """Get all maximal simplices of this simplicial complex.
@@ -1398,7 +1697,12 @@ class SimplicialComplex(Complex):
         >>> SC.get_all_maximal_simplices()
         [(2, 5), (1, 2, 3), (1, 2, 4)]
         """
-        return [tuple(s) for s in self.simplices if self.is_maximal(s)]
+        return [
+            tuple(simplex)
+            for faces in self._simplex_set.faces_dict
+            for simplex, attributes in faces.items()
+            if attributes["is_maximal"]
+        ]
 
     @classmethod
     def from_spharpy(cls, mesh) -> Self:
@@ -1428,15 +1732,13 @@ class SimplicialComplex(Complex):
         vertices = np.array(mesh.vertlist)
         SC = cls(mesh.trilist)
 
-        first_ind = np.min(mesh.trilist)
-
-        if first_ind == 0:
-            SC.set_simplex_attributes(dict(enumerate(vertices)), name="position")
-        else:  # first index starts at 1.
-            SC.set_simplex_attributes(
-                dict(enumerate(vertices, first_ind)),
-                name="position",
-            )
+        # the vertices are numbered from the smallest index used by the faces,
+        # which is 0 or 1 depending on the source of the mesh
+        first_ind = int(np.min(mesh.trilist))
+        SC.set_simplex_attributes(
+            dict(enumerate(vertices, first_ind)),
+            name="position",
+        )
 
         return SC
 
@@ -1456,16 +1758,16 @@ class SimplicialComplex(Complex):
         """
         G = nx.DiGraph()
         for n in self.nodes:
-            G.add_node(tuple(sorted(n)))
+            G.add_node(tuple(n))
+        # simplices of the skeleton are sorted tuples, and so are their faces
         for i in range(1, self.dim + 1):
             for c in self.skeleton(i):
-                G.add_node(tuple(sorted(c)))
-                for f in combinations(c, len(c) - 1):
-                    G.add_edge(tuple(sorted(f)), tuple(sorted(c)))
+                G.add_node(c)
+                G.add_edges_from((f, c) for f in combinations(c, len(c) - 1))
         return G
 
     @classmethod
-    def from_gudhi(cls, tree: SimplexTree) -> Self:
+    def from_gudhi(cls, tree: "SimplexTree") -> Self:
         """Import from gudhi.
 
         Parameters
@@ -1519,18 +1821,13 @@ class SimplicialComplex(Complex):
         """
         SC = cls(mesh.faces)
 
-        first_ind = np.min(mesh.faces)
-
-        if first_ind == 0:
-            SC.set_simplex_attributes(
-                dict(enumerate(mesh.vertices)),
-                name="position",
-            )
-        else:  # first index starts at 1.
-            SC.set_simplex_attributes(
-                dict(enumerate(mesh.vertices, first_ind)),
-                name="position",
-            )
+        # the vertices are numbered from the smallest index used by the faces,
+        # which is 0 or 1 depending on the source of the mesh
+        first_ind = int(mesh.faces.min())
+        SC.set_simplex_attributes(
+            dict(enumerate(mesh.vertices, first_ind)),
+            name="position",
+        )
 
         return SC
 
@@ -1575,9 +1872,14 @@ class SimplicialComplex(Complex):
         """
         if self.dim > 2:
             return False
+        if self.dim < 1:
+            return True
 
-        lst = self.get_all_maximal_simplices()
-        return all(len(i) != 2 for i in lst)
+        # a triangular mesh must not contain edges that are not part of a triangle
+        return not any(
+            attributes["is_maximal"]
+            for attributes in self._simplex_set.faces_dict[1].values()
+        )
 
     def to_trimesh(self, vertex_position_name: str = "position"):
         """Convert simplicial complex to trimesh object.
@@ -1599,12 +1901,9 @@ class SimplicialComplex(Complex):
                 "input simplicial complex has dimension higher than 2 and hence it cannot be converted to a trimesh object"
             )
 
+        # node attributes are already ordered like the sorted 0-skeleton
         vertices = np.array(
-            list(
-                dict(
-                    sorted(self.get_node_attributes(vertex_position_name).items())
-                ).values()
-            )
+            list(self.get_node_attributes(vertex_position_name).values())
         )
 
         return trimesh.Trimesh(
@@ -1652,11 +1951,7 @@ class SimplicialComplex(Complex):
                 "Simplicial complex has dimension higher than 2 and cannot be converted to a trimesh object."
             )
 
-        vertices = list(
-            dict(
-                sorted(self.get_node_attributes(vertex_position_name).items())
-            ).values()
-        )
+        vertices = list(self.get_node_attributes(vertex_position_name).values())
 
         return tm.TriMesh(self.get_all_maximal_simplices(), vertices)
 
@@ -1725,12 +2020,16 @@ class SimplicialComplex(Complex):
         -----
         A simplicial complex is connected iff its 1-skeleton is connected.
         """
-        G = nx.Graph()
-        for edge in self.skeleton(1):
-            G.add_edge(edge[0], edge[1])
-        for node in self.skeleton(0):
-            G.add_node(next(iter(node)))
-        return nx.is_connected(G)
+        from scipy.sparse.csgraph import connected_components
+
+        edges = self._simplex_array(1)
+        n_nodes = len(self._simplex_set.faces_dict[0])
+        graph = coo_matrix(
+            (np.ones(len(edges), dtype=np.int8), (edges[:, 0], edges[:, 1])),
+            shape=(n_nodes, n_nodes),
+        )
+        n_components, _ = connected_components(graph, directed=False)
+        return n_components == 1
 
     @classmethod
     def simplicial_closure_of_hypergraph(cls, H) -> Self:
@@ -1821,9 +2120,14 @@ class SimplicialComplex(Complex):
         from toponetx.classes.combinatorial_complex import CombinatorialComplex
 
         CCC = CombinatorialComplex()
+        # The rank of a simplex grows with inclusion, hence the cells satisfy the
+        # combinatorial complex condition by construction.
         for rank in range(1, self.dim + 1):
-            for cell in self.skeleton(rank):
-                CCC.add_cell(cell, rank=len(cell) - 1, **self[cell])
+            faces = self._simplex_set.faces_dict[rank]
+            CCC.add_cells_unchecked(
+                (cell, rank, faces[cell])
+                for cell in map(frozenset, self.skeleton(rank))
+            )
         return CCC
 
     def graph_skeleton(self) -> nx.Graph:
@@ -27,7 +27,7 @@ from collections.abc import Iterable
 from operator import itemgetter
 
 import numpy as np
-from scipy.sparse import csr_matrix
+from scipy.sparse import csr_matrix, spmatrix
 
 __all__ = [
     "compute_set_incidence",
@@ -240,3 +240,20 @@ def compute_set_incidence(children, uidset, sparse: bool = True, index: bool = F
     if index:
         return {}, {}, np.zeros(1)
     return np.zeros(1)
+
+
+def _abs_inplace(matrix: spmatrix) -> spmatrix:
+    """Replace the entries of a sparse matrix by their absolute values in place.
+
+    Parameters
+    ----------
+    matrix : scipy.sparse.spmatrix
+        A sparse matrix in a format with a `data` array, e.g., CSR, CSC, or COO.
+
+    Returns
+    -------
+    scipy.sparse.spmatrix
+        The same matrix object.
+    """
+    np.abs(matrix.data, out=matrix.data)
+    return matrix